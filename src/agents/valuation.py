@@ -3,7 +3,8 @@ from graph.state import AgentState, show_agent_reasoning
 from utils.progress import progress
 import json
 
-from tools.api import get_financial_metrics, get_market_cap, search_line_items
+from tools.api import get_financial_metrics, get_market_cap
+from utils.analysts import fetch_line_items
 
 
 ##### Valuation Agent #####
@@ -35,19 +36,7 @@ def valuation_agent(state: AgentState):
 
         progress.update_status("valuation_agent", ticker, "Gathering line items")
         # Fetch the specific line_items that we need for valuation purposes
-        financial_line_items = search_line_items(
-            ticker=ticker,
-            line_items=[
-                "free_cash_flow",
-                "net_income",
-                "depreciation_and_amortization",
-                "capital_expenditure",
-                "working_capital",
-            ],
-            end_date=end_date,
-            period="ttm",
-            limit=2,
-        )
+        financial_line_items = fetch_line_items(data, "valuation", ticker)
 
         # Add safety check for financial line items
         if len(financial_line_items) < 2:
@@ -4,7 +4,8 @@ from langchain_core.messages import HumanMessage
 from pydantic import BaseModel
 import json
 from typing_extensions import Literal
-from tools.api import get_financial_metrics, get_market_cap, search_line_items
+from tools.api import get_financial_metrics, get_market_cap
+from utils.analysts import fetch_line_items
 from utils.llm import call_llm
 from utils.progress import progress
 
@@ -31,20 +32,7 @@ def warren_buffett_agent(state: AgentState):
         metrics = get_financial_metrics(ticker, end_date, period="ttm", limit=5)
 
         progress.update_status("warren_buffett_agent", ticker, "Gathering financial line items")
-        financial_line_items = search_line_items(
-            ticker,
-            [
-                "capital_expenditure",
-                "depreciation_and_amortization",
-                "net_income",
-                "outstanding_shares",
-                "total_assets",
-                "total_liabilities",
-            ],
-            end_date,
-            period="ttm",
-            limit=5,
-        )
+        financial_line_items = fetch_line_items(data, "warren_buffett", ticker)
 
         progress.update_status("warren_buffett_agent", ticker, "Getting market cap")
         # Get current market cap
@@ -1,27 +1,30 @@
 import sys
 import asyncio
+import contextvars
 import os
+import hashlib
+import importlib
+import inspect
 import json
-from typing import Dict, Any
+import logging
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
 
+import orjson
+import requests
 from dotenv import load_dotenv
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
 from langchain_core.messages import HumanMessage
-from langgraph.graph import END, StateGraph
+from langgraph.graph import END, START, StateGraph
 from colorama import Fore, Back, Style, init
-import questionary
 from aztp_client import Aztp
-from agents.ben_graham import ben_graham_agent
-from agents.bill_ackman import bill_ackman_agent
-from agents.fundamentals import fundamentals_agent
-from agents.portfolio_manager import portfolio_management_agent
-from agents.technicals import technical_analyst_agent
-from agents.risk_manager import risk_management_agent
-from agents.sentiment import sentiment_agent
-from agents.warren_buffett import warren_buffett_agent
-from graph.state import AgentState
-from agents.valuation import valuation_agent
+from aztp_client.common import AuthenticationError
+from graph.state import AgentState, show_agent_reasoning
 from utils.display import print_trading_output
-from utils.analysts import ANALYST_ORDER, get_analyst_nodes
+from utils.analysts import ANALYST_CONFIG, ANALYST_ORDER, get_analyst_nodes
 from utils.progress import progress
 from llm.models import LLM_ORDER, get_model_info
 
@@ -36,20 +39,137 @@ load_dotenv()
 
 init(autoreset=True)
 
-async def secure_wrap_agents(client: Aztp) -> Dict[str, Any]:
-    """Wrap existing agents with secure connections."""
+# Per-agent AZTP diagnostics are logged at debug level, enabled by main() when AZTP_DEBUG is set
+logger = logging.getLogger(__name__)
+
+# LLM models offered by the CLI, as "model_name (provider)"
+MODEL_CHOICES = [
+    "gpt-4 (OpenAI)",
+    "gpt-3.5-turbo (OpenAI)",
+    "claude-3-opus-20240229 (Anthropic)",
+    "claude-3-sonnet-20240229 (Anthropic)",
+    "mixtral-8x7b-32768 (Groq)",
+]
+
+# Agent modules and functions by agent name, imported only when that agent is secured
+_AGENT_MODULES = {
+    "warren_buffett": ("agents.warren_buffett", "warren_buffett_agent"),
+    "ben_graham": ("agents.ben_graham", "ben_graham_agent"),
+    "bill_ackman": ("agents.bill_ackman", "bill_ackman_agent"),
+    "fundamentals": ("agents.fundamentals", "fundamentals_agent"),
+    "technicals": ("agents.technicals", "technical_analyst_agent"),
+    "sentiment": ("agents.sentiment", "sentiment_agent"),
+    "valuation": ("agents.valuation", "valuation_agent"),
+    "portfolio": ("agents.portfolio_manager", "portfolio_management_agent"),
+    "risk": ("agents.risk_manager", "risk_management_agent"),
+}
+
+# Reasoning titles of the analysts run per ticker, matching the ones they print themselves
+_REASONING_TITLES = {
+    "warren_buffett": "Warren Buffett Agent",
+    "ben_graham": "Ben Graham Agent",
+    "bill_ackman": "Bill Ackman Agent",
+    "fundamentals": "Fundamental Analysis Agent",
+    "technicals": "Technical Analyst",
+    "sentiment": "Sentiment Analysis Agent",
+    "valuation": "Valuation Analysis Agent",
+}
+
+def load_agent(name: str):
+    """Import and return the agent function for an agent name."""
+    module_name, function_name = _AGENT_MODULES[name]
+    return getattr(importlib.import_module(module_name), function_name)
+
+# AZTP clients and secured agents, keyed by a hash of the AZTP API key, so that
+# repeated runs in the same process reuse the connections made by the first one
+_CLIENT_CACHE: dict[str, Aztp] = {}
+_SECURED_CACHE: dict[str, Dict[str, Any]] = {}
+
+# Compiled workflows, keyed by the analysts they run and the secured agents cache key
+_GRAPH_CACHE: dict[tuple, Any] = {}
+
+# Maximum number of agent runs in flight at once, shared by every agent node, to
+# respect LLM and data provider rate limits. It defaults to enough for every analyst
+# to run at once. Sync agents run on a dedicated thread pool of the same size so the
+# limit holds regardless of the loop's default executor.
+_MAX_AGENT_CONCURRENCY = int(os.getenv("MAX_AGENT_CONCURRENCY", str(max(10, len(ANALYST_ORDER)))))
+_AGENT_EXECUTOR = ThreadPoolExecutor(max_workers=_MAX_AGENT_CONCURRENCY, thread_name_prefix="agent")
+
+# asyncio primitives bind to the event loop they are first used on, and callers
+# may drive the hedge fund from several loops (e.g. one asyncio.run per call)
+_LOOP_PRIMITIVES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Any, Any]]" = weakref.WeakKeyDictionary()
+
+def _loop_local(key, factory):
+    """Return the asyncio primitive stored under key for the running loop, creating it if needed."""
+    primitives = _LOOP_PRIMITIVES.setdefault(asyncio.get_running_loop(), {})
+    if key not in primitives:
+        primitives[key] = factory()
+    return primitives[key]
+
+async def run_agent_bounded(agent, state: AgentState):
+    """Run an agent under the shared agent concurrency limit."""
+    async with _loop_local("agent_semaphore", lambda: asyncio.Semaphore(_MAX_AGENT_CONCURRENCY)):
+        if inspect.iscoroutinefunction(agent):
+            return await agent(state)
+        # Run sync agents on the agent thread pool, keeping contextvars for LangChain callbacks
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(_AGENT_EXECUTOR, context.run, agent, state)
+
+async def run_per_ticker(run_agent, state: AgentState, reasoning_title: str) -> Dict[str, Any]:
+    """Run an analyst concurrently on each ticker and merge the per-ticker results."""
+    tickers = state["data"]["tickers"]
+    if len(tickers) < 2:
+        return await run_agent(state)
+    
+    async def run_ticker(ticker: str):
+        # Each run gets its own signals dict but shares the request-scoped cache;
+        # reasoning is shown once for all tickers below instead of once per run
+        data = {**state["data"], "tickers": [ticker], "analyst_signals": {}}
+        metadata = {**state["metadata"], "show_reasoning": False}
+        return await run_agent({**state, "data": data, "metadata": metadata})
+    
+    results = await asyncio.gather(*[run_ticker(ticker) for ticker in tickers])
+    
+    # Merge the signals and the per-ticker messages back together
+    analyst_signals = state["data"]["analyst_signals"]
+    content = {}
+    for result in results:
+        for agent_name, signals in result["data"]["analyst_signals"].items():
+            analyst_signals.setdefault(agent_name, {}).update(signals)
+        content.update(json.loads(result["messages"][-1].content))
+    
+    if state["metadata"]["show_reasoning"]:
+        show_agent_reasoning(content, reasoning_title)
+    
+    message = HumanMessage(content=json.dumps(content), name=results[-1]["messages"][-1].name)
+    return {"messages": [message], "data": state["data"]}
+
+# Maximum number of AZTP requests in flight at once, in case the service rate limits us.
+# AZTP calls run on their own thread pool of the same size, see _aztp_bounded.
+_MAX_AZTP_CONCURRENCY = int(os.getenv("AZTP_MAX_CONCURRENCY", "10"))
+_AZTP_EXECUTOR = ThreadPoolExecutor(max_workers=_MAX_AZTP_CONCURRENCY, thread_name_prefix="aztp")
+
+async def _aztp_bounded(coro):
+    """Await an AZTP call under the AZTP concurrency limit.
+    
+    The AZTP client's methods are coroutines but make blocking HTTP requests without
+    ever awaiting, so each call is run to completion on the AZTP thread pool; this
+    keeps the event loop free and lets the calls actually overlap.
+    """
+    async with _loop_local("aztp_semaphore", lambda: asyncio.Semaphore(_MAX_AZTP_CONCURRENCY)):
+        return await asyncio.get_running_loop().run_in_executor(_AZTP_EXECUTOR, asyncio.run, coro)
+
+def _is_auth_error(error: Exception) -> bool:
+    """Whether an AZTP call failed because the client's credentials were rejected."""
+    if isinstance(error, AuthenticationError):
+        return True
+    response = getattr(error, "response", None)
+    return isinstance(error, requests.HTTPError) and response is not None and response.status_code in (401, 403)
+
+async def secure_wrap_agents(client: Aztp, agent_names: list[str]) -> Dict[str, Any]:
+    """Wrap the named agents with secure connections."""
     # Map of agent names to their instances
-    agents = {
-        "warren_buffett": warren_buffett_agent,
-        "ben_graham": ben_graham_agent,
-        "bill_ackman": bill_ackman_agent,
-        "fundamentals": fundamentals_agent,
-        "technicals": technical_analyst_agent,
-        "sentiment": sentiment_agent,
-        "valuation": valuation_agent,
-        "portfolio": portfolio_management_agent,
-        "risk": risk_management_agent
-    }
+    agents = {name: load_agent(name) for name in agent_names}
     
     # Map of agent keys to their AZTP-compliant names
     aztp_names = {
@@ -64,50 +184,112 @@ async def secure_wrap_agents(client: Aztp) -> Dict[str, Any]:
         "risk": "risk"
     }
     
-    print("\nInitializing secure agent connections...")
+    # Make the secured agent awaitable so LangGraph runs it on the event loop;
+    # sync agents are pushed to the agent thread pool so they don't block it
+    def make_callable(secure_conn, reasoning_title: Optional[str]):
+        async def run_agent(state: AgentState):
+            return await run_agent_bounded(secure_conn._agent, state)  # Use the original agent function
+        
+        async def wrapped_agent(state: AgentState):
+            if reasoning_title is not None:
+                return await run_per_ticker(run_agent, state, reasoning_title)
+            return await run_agent(state)
+        
+        wrapped_agent.secure_conn = secure_conn
+        wrapped_agent.__wrapped__ = secure_conn._agent
+        return wrapped_agent
     
-    # Secure each agent with AZTP
-    secured_agents = {}
-    for name, agent in agents.items():
-        print(f"Securing {name} agent...")
-        secured_conn = await client.secure_connect(
-            agent,
-            name=f"{aztp_names[name]}-analyst"
-        )
+    # Announce the agents being secured in one write, before any AZTP round-trips
+    sys.stdout.write("\n".join(["\nInitializing secure agent connections..."] + [f"Securing {name} agent..." for name in agents]) + "\n")
+    
+    # Collect the remaining status messages and write them in one go, even if securing fails
+    status_lines = []
+    try:
+        # Secure all agents with AZTP concurrently
+        secured_conns = await asyncio.gather(*[
+            _aztp_bounded(client.secure_connect(agent, name=f"{aztp_names[name]}-analyst"))
+            for name, agent in agents.items()
+        ])
         
-        # Make the secured agent callable while maintaining sync interface
-        def make_callable(secure_conn):
-            def wrapped_agent(state: AgentState):
-                return secure_conn._agent(state)  # Use the original agent function
-            return wrapped_agent
-            
-        secured_agents[name] = make_callable(secured_conn)
+        secured_agents = {
+            # Risk and portfolio management size positions across all tickers at once
+            name: make_callable(secured_conn, _REASONING_TITLES.get(name))
+            for name, secured_conn in zip(agents.keys(), secured_conns)
+        }
+        
+        # Verify all agents
+        status_lines.append("\nVerifying agent identities...")
+        verification_tasks = [
+            _aztp_bounded(client.verify_identity(agent.secure_conn))
+            for agent in secured_agents.values()
+        ]
+        agents_valid = await asyncio.gather(*verification_tasks)
+        
+        if not all(agents_valid):
+            raise ValueError("Agent verification failed")
+        
+        # Record when each agent was verified so cached agents can skip re-verification for a while
+        verified_at = time.monotonic()
+        for agent in secured_agents.values():
+            agent.verified_at = verified_at
+        
+        # Log identities for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            identities = await asyncio.gather(*[
+                _aztp_bounded(client.get_identity(agent.secure_conn))
+                for agent in secured_agents.values()
+            ])
+            for name, identity in zip(secured_agents.keys(), identities):
+                logger.debug("%s Identity: %s", name.title(), identity)
+        
+        status_lines.append("\nAll agents verified successfully!")
+        return secured_agents
+    finally:
+        if status_lines:
+            sys.stdout.write("\n".join(status_lines) + "\n")
+
+async def reverify_agents(client: Aztp, secured_agents: Dict[str, Any]) -> bool:
+    """Re-verify cached agents last verified more than AZTP_VERIFY_INTERVAL_SECS ago.
     
-    # Verify all agents
-    print("\nVerifying agent identities...")
-    verification_tasks = [
-        client.verify_identity(agent.__closure__[0].cell_contents)  # Get the underlying SecureConnection
-        for name, agent in secured_agents.items()
-    ]
-    agents_valid = await asyncio.gather(*verification_tasks)
+    Returns False if any agent fails verification or AZTP rejects the client's
+    credentials; any other error while verifying is raised.
+    """
+    interval = float(os.getenv("AZTP_VERIFY_INTERVAL_SECS", "3600"))
+    now = time.monotonic()
+    stale_agents = [agent for agent in secured_agents.values() if now - agent.verified_at >= interval]
+    if not stale_agents:
+        return True
     
-    if not all(agents_valid):
-        raise ValueError("Agent verification failed")
+    async def verify(agent):
+        try:
+            return await _aztp_bounded(client.verify_identity(agent.secure_conn))
+        except Exception as e:
+            if _is_auth_error(e):
+                return False
+            raise
     
-    # Print identities for debugging
-    for name, agent in secured_agents.items():
-        identity = await client.get_identity(agent.__closure__[0].cell_contents)  # Get the underlying SecureConnection
-        print(f"\n{name.title()} Identity:", identity)
+    results = await asyncio.gather(*[verify(agent) for agent in stale_agents])
+    if not all(results):
+        return False
     
-    print("\nAll agents verified successfully!")
-    return secured_agents
+    for agent in stale_agents:
+        agent.verified_at = now
+    return True
 
-def parse_hedge_fund_response(response):
-    import json
+def _init_caches():
+    """Enable LangChain's global LLM cache so identical prompts are only sent once per process."""
+    if get_llm_cache() is None:
+        # Bound the cache so long-running processes don't grow without limit
+        set_llm_cache(InMemoryCache(maxsize=int(os.getenv("LLM_CACHE_MAXSIZE", "1000"))))
 
+def parse_hedge_fund_response(response):
+    # LangChain may hand back content that is already parsed; callers expect a dict
+    if isinstance(response, dict):
+        return response
+    
     try:
-        return json.loads(response)
-    except:
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
         print(f"Error parsing response: {response}")
         return None
 
@@ -119,31 +301,28 @@ def create_workflow(selected_analysts: list[str], secured_agents: Dict[str, Any]
     # Create workflow with selected analysts
     workflow = StateGraph(AgentState)
     
-    # Add START node
-    def start_node(state: AgentState):
-        """Initialize the workflow."""
-        return state
-    
-    workflow.add_node("START", start_node)
+    # Analysts have no data dependencies on each other, so fan them out from
+    # START and fan them back in at risk management, which consumes their signals
+    workflow.add_node("risk_management_agent", secured_agents["risk"])
+    workflow.add_node("portfolio_management_agent", secured_agents["portfolio"])
     
-    # Add analyst nodes
-    for analyst in selected_analysts:
-        if analyst in analyst_nodes:
-            workflow.add_node(analyst, analyst_nodes[analyst])
-            # Connect START to first analyst
-            if analyst == selected_analysts[0]:
-                workflow.add_edge("START", analyst)
+    # Add analyst nodes in a single pass, defaulting to all analysts
+    added_analysts = False
+    for analyst in selected_analysts or ANALYST_ORDER:
+        if analyst not in analyst_nodes:
+            continue
+        workflow.add_node(analyst, analyst_nodes[analyst])
+        workflow.add_edge(START, analyst)
+        workflow.add_edge(analyst, "risk_management_agent")
+        added_analysts = True
     
-    # Add edges between analysts in sequence
-    for i in range(len(selected_analysts) - 1):
-        workflow.add_edge(selected_analysts[i], selected_analysts[i + 1])
+    # Without any analysts, go straight to risk management
+    if not added_analysts:
+        workflow.add_edge(START, "risk_management_agent")
     
-    # Add edge from last analyst to END
-    if selected_analysts:
-        workflow.add_edge(selected_analysts[-1], END)
-    
-    # Set entry point
-    workflow.set_entry_point("START")
+    # Risk management feeds the portfolio manager, which makes the final decisions
+    workflow.add_edge("risk_management_agent", "portfolio_management_agent")
+    workflow.add_edge("portfolio_management_agent", END)
     
     return workflow
 
@@ -157,53 +336,98 @@ async def run_hedge_fund(
     selected_analysts: list[str] = [],
     model_name: str = "gpt-4",
     model_provider: str = "OpenAI",
+    on_signals: Optional[Callable[[str, dict], Any]] = None,
 ):
-    """Run the hedge fund with secured agents."""
+    """Run the hedge fund with secured agents.
+    
+    If on_signals is given, it is called (and awaited, if it returns an awaitable)
+    with each analyst or risk management node name and that node's signals by
+    ticker as soon as the node finishes, before the final decisions are made.
+    """
     try:
         # Initialize AZTP client
         api_key = os.getenv("AZTP_API_KEY")
         if not api_key:
             raise ValueError("AZTP_API_KEY is required")
         
-        client = Aztp(api_key=api_key)
+        cache_key = hashlib.sha256(api_key.encode()).hexdigest()
+        
+        # Use all analysts in default order unless they are customized
+        analysts = selected_analysts or ANALYST_ORDER
+        
+        # Serialize securing per API key so concurrent cold runs don't secure the same agents twice
+        async with _loop_local(("secure", cache_key), asyncio.Lock):
+            client = _CLIENT_CACHE.get(cache_key)
+            if client is None:
+                client = _CLIENT_CACHE[cache_key] = Aztp(api_key=api_key)
+            
+            # Wrap the agents this run needs with secure connections, reusing any already secured
+            secured_agents = _SECURED_CACHE.setdefault(cache_key, {})
+            
+            # Trust cached agents until their verification expires; if re-verifying fails,
+            # start over with a fresh client and fully secure and verify every agent again
+            if not await reverify_agents(client, secured_agents):
+                client = _CLIENT_CACHE[cache_key] = Aztp(api_key=api_key)
+                secured_agents = _SECURED_CACHE[cache_key] = {}
+                for graph_key in [key for key in _GRAPH_CACHE if key[1] == cache_key]:
+                    del _GRAPH_CACHE[graph_key]
+            
+            agent_names = [ANALYST_CONFIG[analyst]["key"] for analyst in analysts if analyst in ANALYST_CONFIG] + ["risk", "portfolio"]
+            missing_agents = [name for name in agent_names if name not in secured_agents]
+            if missing_agents:
+                secured_agents.update(await secure_wrap_agents(client, missing_agents))
         
-        # Wrap existing agents with secure connections
-        secured_agents = await secure_wrap_agents(client)
+        # Deduplicate identical LLM calls across tickers and runs
+        _init_caches()
         
         # Start progress tracking
         progress.start()
         
         try:
-            # Create a new workflow if analysts are customized
-            if selected_analysts:
-                workflow = create_workflow(selected_analysts, secured_agents)
-                agent = workflow.compile()
-            else:
-                # Use all analysts in default order
-                workflow = create_workflow(ANALYST_ORDER, secured_agents)
-                agent = workflow.compile()
+            # Reuse the compiled workflow for this set of analysts if we have one
+            graph_key = (tuple(analysts), cache_key)
+            agent = _GRAPH_CACHE.get(graph_key)
+            if agent is None:
+                workflow = create_workflow(analysts, secured_agents)
+                agent = _GRAPH_CACHE[graph_key] = workflow.compile()
             
-            final_state = agent.invoke(
-                {
-                    "messages": [
-                        HumanMessage(
-                            content="Make trading decisions based on the provided data.",
-                        )
-                    ],
-                    "data": {
-                        "tickers": tickers,
-                        "portfolio": portfolio,
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "analyst_signals": {},
-                    },
-                    "metadata": {
-                        "show_reasoning": show_reasoning,
-                        "model_name": model_name,
-                        "model_provider": model_provider,
-                    },
+            inputs = {
+                "messages": [
+                    HumanMessage(
+                        content="Make trading decisions based on the provided data.",
+                    )
+                ],
+                "data": {
+                    "tickers": tickers,
+                    "portfolio": portfolio,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "analyst_signals": {},
+                    "cache": {},  # Request-scoped cache for line items shared by analysts, see utils.analysts.fetch_line_items
                 },
-            )
+                "metadata": {
+                    "show_reasoning": show_reasoning,
+                    "model_name": model_name,
+                    "model_provider": model_provider,
+                },
+            }
+            
+            # Stream the state so each node's signals can be handed to on_signals as
+            # soon as it finishes instead of only once the whole graph is done
+            final_state = None
+            async for mode, chunk in agent.astream(inputs, stream_mode=["updates", "values"]):
+                if mode == "values":
+                    final_state = chunk
+                    continue
+                if on_signals is None:
+                    continue
+                for node_name, update in chunk.items():
+                    # The portfolio manager's output is the final decisions, not signals
+                    if node_name == "portfolio_management_agent" or not update or not update.get("messages"):
+                        continue
+                    result = on_signals(node_name, orjson.loads(update["messages"][-1].content))
+                    if inspect.isawaitable(result):
+                        await result
             
             return {
                 "decisions": parse_hedge_fund_response(final_state["messages"][-1].content),
@@ -221,6 +445,11 @@ async def run_hedge_fund(
         return None
 
 def main():
+    # Show per-agent AZTP diagnostics when debugging
+    if os.getenv("AZTP_DEBUG"):
+        logging.basicConfig()
+        logger.setLevel(logging.DEBUG)
+    
     parser = argparse.ArgumentParser(description="AI Hedge Fund")
     parser.add_argument(
         "--tickers",
@@ -259,41 +488,45 @@ def main():
         choices=ANALYST_ORDER,
         default=[],
     )
+    parser.add_argument(
+        "--model",
+        type=str,
+        help="LLM model to use. Prompts for one if not given",
+        choices=[choice.split(" (")[0] for choice in MODEL_CHOICES],
+    )
     
     args = parser.parse_args()
     
     # Parse tickers from comma-separated string
     tickers = [ticker.strip() for ticker in args.tickers.split(",")]
     
-    # Set the start and end dates
-    end_date = args.end_date or datetime.now().strftime("%Y-%m-%d")
-    if not args.start_date:
-        # Calculate 3 months before end_date
-        end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
-        start_date = (end_date_obj - relativedelta(months=3)).strftime("%Y-%m-%d")
-    else:
-        start_date = args.start_date
+    # Set the start and end dates, defaulting to the 3 months up to today
+    try:
+        end_date_obj = datetime.strptime(args.end_date, "%Y-%m-%d").date() if args.end_date else datetime.now().date()
+        start_date_obj = datetime.strptime(args.start_date, "%Y-%m-%d").date() if args.start_date else end_date_obj - relativedelta(months=3)
+    except ValueError:
+        print("Error: Invalid date, expected YYYY-MM-DD")
+        sys.exit(1)
     
     # Parse portfolio JSON
     try:
-        portfolio = json.loads(args.portfolio)
-    except json.JSONDecodeError:
+        portfolio = orjson.loads(args.portfolio)
+    except orjson.JSONDecodeError:
         print("Error: Invalid portfolio JSON")
         sys.exit(1)
     
-    # Get model choice
-    model_choices = [
-        "gpt-4 (OpenAI)",
-        "gpt-3.5-turbo (OpenAI)",
-        "claude-3-opus-20240229 (Anthropic)",
-        "claude-3-sonnet-20240229 (Anthropic)",
-        "mixtral-8x7b-32768 (Groq)",
-    ]
-    model_choice = questionary.select(
-        "Select LLM model:",
-        choices=model_choices,
-        default=model_choices[0],
-    ).ask()
+    # Get model choice, prompting for it unless it was given on the command line
+    if args.model:
+        model_choice = next(choice for choice in MODEL_CHOICES if choice.split(" (")[0] == args.model)
+    else:
+        # Imported here so non-interactive runs don't pay for loading it
+        import questionary
+        
+        model_choice = questionary.select(
+            "Select LLM model:",
+            choices=MODEL_CHOICES,
+            default=MODEL_CHOICES[0],
+        ).ask()
     
     # Extract model name and provider
     model_name = model_choice.split(" (")[0]
@@ -302,13 +535,14 @@ def main():
     # Run the hedge fund
     result = asyncio.run(run_hedge_fund(
         tickers=tickers,
-        start_date=start_date,
-        end_date=end_date,
+        start_date=start_date_obj.strftime("%Y-%m-%d"),
+        end_date=end_date_obj.strftime("%Y-%m-%d"),
         portfolio=portfolio,
         show_reasoning=args.show_reasoning,
         selected_analysts=args.analysts,
         model_name=model_name,
         model_provider=model_provider,
+        on_signals=progress.print_signals,  # Show each analyst's signals as soon as it finishes
     ))
     
     if result:
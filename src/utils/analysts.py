@@ -1,7 +1,11 @@
 """Constants and utilities related to analysts configuration."""
 
+import threading
+from concurrent.futures import Future
 from typing import Dict, Any
 
+from data.models import LineItem
+
 # Define analyst configuration - single source of truth
 ANALYST_CONFIG = {
     "ben_graham": {
@@ -47,6 +51,9 @@ ANALYST_ORDER = sorted(
     key=lambda x: ANALYST_CONFIG[x]["order"]
 )
 
+# Unsecured analyst nodes, built on first use by get_analyst_nodes
+_UNSECURED_NODES = None
+
 def get_analyst_nodes(secured_agents: Dict[str, Any] = None) -> Dict[str, Any]:
     """Get analyst nodes for the workflow.
     
@@ -57,33 +64,152 @@ def get_analyst_nodes(secured_agents: Dict[str, Any] = None) -> Dict[str, Any]:
     Returns:
         Dictionary mapping analyst names to their agent instances.
     """
+    global _UNSECURED_NODES
+    
     if secured_agents is None:
-        # Backward compatibility - import and use unsecured agents
-        from agents.ben_graham import ben_graham_agent
-        from agents.bill_ackman import bill_ackman_agent
-        from agents.warren_buffett import warren_buffett_agent
-        from agents.technicals import technical_analyst_agent
-        from agents.fundamentals import fundamentals_agent
-        from agents.sentiment import sentiment_agent
-        from agents.valuation import valuation_agent
+        if _UNSECURED_NODES is None:
+            # Backward compatibility - import and use unsecured agents
+            from agents.ben_graham import ben_graham_agent
+            from agents.bill_ackman import bill_ackman_agent
+            from agents.warren_buffett import warren_buffett_agent
+            from agents.technicals import technical_analyst_agent
+            from agents.fundamentals import fundamentals_agent
+            from agents.sentiment import sentiment_agent
+            from agents.valuation import valuation_agent
+            
+            _UNSECURED_NODES = {
+                "ben_graham": ben_graham_agent,
+                "bill_ackman": bill_ackman_agent,
+                "warren_buffett": warren_buffett_agent,
+                "technical_analyst": technical_analyst_agent,
+                "fundamentals_analyst": fundamentals_agent,
+                "sentiment_analyst": sentiment_agent,
+                "valuation_analyst": valuation_agent,
+            }
+        return _UNSECURED_NODES
+    
+    # Map secured agents to their workflow nodes, skipping analysts that weren't secured
+    return {name: secured_agents[config["key"]] for name, config in ANALYST_CONFIG.items() if config["key"] in secured_agents}
+
+
+# The search_line_items query of each analyst that needs line items, by analyst key.
+# Analysts that use the same period share one request per ticker for the union of
+# their line items, fetched with the largest of their limits, see fetch_line_items.
+LINE_ITEM_QUERIES = {
+    "ben_graham": {
+        "line_items": [
+            "earnings_per_share",
+            "revenue",
+            "net_income",
+            "book_value_per_share",
+            "total_assets",
+            "total_liabilities",
+            "current_assets",
+            "current_liabilities",
+            "dividends_and_other_cash_distributions",
+            "outstanding_shares",
+        ],
+        "period": "annual",
+        "limit": 10,
+    },
+    "bill_ackman": {
+        "line_items": [
+            "revenue",
+            "operating_margin",
+            "debt_to_equity",
+            "free_cash_flow",
+            "total_assets",
+            "total_liabilities",
+            "dividends_and_other_cash_distributions",
+            "outstanding_shares",
+        ],
+        "period": "annual",
+        "limit": 5,
+    },
+    "warren_buffett": {
+        "line_items": [
+            "capital_expenditure",
+            "depreciation_and_amortization",
+            "net_income",
+            "outstanding_shares",
+            "total_assets",
+            "total_liabilities",
+        ],
+        "period": "ttm",
+        "limit": 5,
+    },
+    "valuation": {
+        "line_items": [
+            "free_cash_flow",
+            "net_income",
+            "depreciation_and_amortization",
+            "capital_expenditure",
+            "working_capital",
+        ],
+        "period": "ttm",
+        "limit": 2,
+    },
+}
+
+# The shared query for each period: the union of the line items and the largest limit
+_LINE_ITEM_BATCHES: Dict[str, Dict[str, Any]] = {}
+for _query in LINE_ITEM_QUERIES.values():
+    _batch = _LINE_ITEM_BATCHES.setdefault(_query["period"], {"line_items": [], "limit": 0})
+    _batch["line_items"] += [item for item in _query["line_items"] if item not in _batch["line_items"]]
+    _batch["limit"] = max(_batch["limit"], _query["limit"])
+
+# Guards request-scoped cache lookups, since analysts fetch from parallel threads
+_CACHE_LOCK = threading.Lock()
+
+def fetch_line_items(data: Dict[str, Any], analyst: str, ticker: str) -> list[LineItem]:
+    """Fetch an analyst's line items for a ticker, sharing one request with other analysts.
+    
+    Line items are the only analyst data not already cached process-wide by
+    ``tools.api``. Instead of each analyst searching for its own line items, the
+    first analyst to ask for a ticker and period fetches the line items of every
+    analyst in ``LINE_ITEM_QUERIES`` using that period, and the result is memoized
+    in the request-scoped ``data["cache"]`` dict that ``run_hedge_fund`` creates for
+    each invocation. Analysts asking while that fetch is in flight wait for it.
+    Each analyst gets the first ``limit`` results of its own query, which is what
+    searching with that limit returns.
+    
+    Args:
+        data: The ``data`` dict from the agent state.
+        analyst: The analyst key in ``LINE_ITEM_QUERIES``, e.g. ``"ben_graham"``.
+        ticker: The ticker to fetch line items for.
+    
+    Returns:
+        The line items, most recent first, as returned by ``search_line_items``.
+    """
+    query = LINE_ITEM_QUERIES[analyst]
+    period = query["period"]
+    key = (ticker, data["end_date"], period)
+    
+    with _CACHE_LOCK:
+        cache = data.setdefault("cache", {})
+        result = cache.get(key)
+        owner = result is None
+        if owner:
+            result = cache[key] = Future()
+    
+    if owner:
+        # Imported here so importing the analyst configuration doesn't load the data tools
+        from tools.api import search_line_items
         
-        return {
-            "ben_graham": ben_graham_agent,
-            "bill_ackman": bill_ackman_agent,
-            "warren_buffett": warren_buffett_agent,
-            "technical_analyst": technical_analyst_agent,
-            "fundamentals_analyst": fundamentals_agent,
-            "sentiment_analyst": sentiment_agent,
-            "valuation_analyst": valuation_agent,
-        }
+        batch = _LINE_ITEM_BATCHES[period]
+        try:
+            line_items = search_line_items(ticker, batch["line_items"], data["end_date"], period=period, limit=batch["limit"])
+        except Exception as e:
+            # Drop failed fetches so a later call can retry
+            with _CACHE_LOCK:
+                cache.pop(key, None)
+            result.set_exception(e)
+            raise
+        # Keep only the results in the cache once waiting analysts have them
+        result.set_result(line_items)
+        with _CACHE_LOCK:
+            cache[key] = line_items
     
-    # Map secured agents to their workflow nodes
-    return {
-        "ben_graham": secured_agents["ben_graham"],
-        "bill_ackman": secured_agents["bill_ackman"],
-        "warren_buffett": secured_agents["warren_buffett"],
-        "technical_analyst": secured_agents["technicals"],
-        "fundamentals_analyst": secured_agents["fundamentals"],
-        "sentiment_analyst": secured_agents["sentiment"],
-        "valuation_analyst": secured_agents["valuation"],
-    }
+    if isinstance(result, Future):
+        result = result.result()
+    return result[:query["limit"]]
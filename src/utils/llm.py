@@ -36,18 +36,24 @@ def call_llm(
     model_info = get_model_info(model_name)
     llm = get_model(model_name, model_provider)
     
+    # Retries skip the LLM cache, which would otherwise replay the response that just failed
+    uncached_llm = llm.model_copy(update={"cache": False})
+    
     # For non-Deepseek models, we can use structured output
     if not (model_info and model_info.is_deepseek()):
-        llm = llm.with_structured_output(
-            pydantic_model,
-            method="json_mode",
+        llm, uncached_llm = (
+            model.with_structured_output(
+                pydantic_model,
+                method="json_mode",
+            )
+            for model in (llm, uncached_llm)
         )
     
     # Call the LLM with retries
     for attempt in range(max_retries):
         try:
             # Call the LLM
-            result = llm.invoke(prompt)
+            result = (llm if attempt == 0 else uncached_llm).invoke(prompt)
             
             # For Deepseek, we need to extract and parse the JSON manually
             if model_info and model_info.is_deepseek():
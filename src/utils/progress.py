@@ -42,6 +42,15 @@ class AgentProgress:
 
         self._refresh_display()
 
+    def print_signals(self, agent_name: str, signals: Dict[str, dict]):
+        """Print an agent's signals by ticker above the progress display as soon as it finishes."""
+        agent_display = agent_name.replace("_agent", "").replace("_", " ").title()
+        summary = ", ".join(
+            f"{ticker} {signal['signal']}" if isinstance(signal, dict) and "signal" in signal else ticker
+            for ticker, signal in signals.items()
+        )
+        console.print(f"{agent_display} done: {summary}", highlight=False, markup=False)
+
     def _refresh_display(self):
         """Refresh the progress display."""
         self.table.columns.clear()